@@ -9,7 +9,7 @@ import queue
 import random
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Set, Tuple
 
 import webbrowser
 
@@ -61,6 +61,8 @@ from .constants import (
     THEME_PALETTES,
     JELLYFIN_WEB_UI_URL,
     JELLYFIN_WEB_UI_URL_ENV,
+    JELLYFIN_WEBVIEW_IDLE_POLL_MS,
+    JELLYFIN_WEBVIEW_POLL_MS,
     OPENROUTER_API_KEY_ENV,
 )
 from .openrouter import request_chat_completion, verify_api_key
@@ -94,8 +96,8 @@ class ApertureLauncherGUI(tk.Tk):
         self.api_key_var = tk.StringVar(value=os.environ.get(OPENROUTER_API_KEY_ENV, ""))
         self.general_model_var = tk.StringVar(value=GENERAL_CHAT_MODELS[0])
         self.roasting_model_var = tk.StringVar(value=GENERAL_CHAT_MODELS[0])
-        self.general_persona_var = tk.StringVar(value=list(GENERAL_CHAT_PERSONAS.keys())[0])
-        self.roasting_voice_var = tk.StringVar(value=list(ROASTING_PERSONAS.keys())[0])
+        self.general_persona_var = tk.StringVar(value=next(iter(GENERAL_CHAT_PERSONAS)))
+        self.roasting_voice_var = tk.StringVar(value=next(iter(ROASTING_PERSONAS)))
         self.roasting_game_var = tk.StringVar(value="")
         self.include_os_var = tk.BooleanVar(value=True)
         self.jellyfin_web_url_var = tk.StringVar(
@@ -110,7 +112,10 @@ class ApertureLauncherGUI(tk.Tk):
         )
 
         self.games: List[SteamGame] = []
+        self._games_by_id: Dict[str, SteamGame] = {}
         self._text_widgets: List[tk.Text] = []
+        self._chat_tag_names: Dict[str, str] = {}
+        self._configured_chat_tags: Set[Tuple[str, str]] = set()
         self._rng = random.Random()
         self._os_summary = platform.platform() or platform.system() or "Unknown OS"
 
@@ -133,6 +138,8 @@ class ApertureLauncherGUI(tk.Tk):
 
         self._jellyfin_webview_process: mp.Process | None = None
         self._jellyfin_webview_queue: mp.Queue | None = None
+        self._jellyfin_webview_started = False
+        self._applied_theme: str | None = None
 
         self._build_ui()
         self._apply_theme()
@@ -642,6 +649,7 @@ class ApertureLauncherGUI(tk.Tk):
 
         self._jellyfin_webview_queue = status_queue
         self._jellyfin_webview_process = process
+        self._jellyfin_webview_started = False
         self.jellyfin_web_status_var.set("Launching embedded Jellyfin portal...")
         self.after(200, self._poll_jellyfin_webview_status)
 
@@ -657,6 +665,7 @@ class ApertureLauncherGUI(tk.Tk):
             while True:
                 state, message = status_queue.get_nowait()
                 if state == "started":
+                    self._jellyfin_webview_started = True
                     self.jellyfin_web_status_var.set(message)
                 elif state == "closed":
                     self._clear_jellyfin_webview_state(closed=True)
@@ -669,7 +678,13 @@ class ApertureLauncherGUI(tk.Tk):
             pass
 
         if process.is_alive():
-            self.after(250, self._poll_jellyfin_webview_status)
+            # Once the window is up only a close or crash remains to be noticed.
+            interval = (
+                JELLYFIN_WEBVIEW_IDLE_POLL_MS
+                if self._jellyfin_webview_started
+                else JELLYFIN_WEBVIEW_POLL_MS
+            )
+            self.after(interval, self._poll_jellyfin_webview_status)
             return
 
         exit_code = process.exitcode
@@ -699,6 +714,7 @@ class ApertureLauncherGUI(tk.Tk):
 
         self._jellyfin_webview_process = None
         self._jellyfin_webview_queue = None
+        self._jellyfin_webview_started = False
 
         if status_queue is not None:
             try:
@@ -757,7 +773,12 @@ class ApertureLauncherGUI(tk.Tk):
     def _apply_theme(self) -> None:
         """Update widget colors based on the selected theme."""
 
-        palette = THEME_PALETTES[self.theme_var.get()]
+        theme = self.theme_var.get()
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+
+        palette = THEME_PALETTES[theme]
         selected_tab_text = palette.get("text_on_accent", palette["text"])
 
         self.configure(bg=palette["background"])
@@ -836,22 +857,19 @@ class ApertureLauncherGUI(tk.Tk):
         self.option_add("*TCombobox*Listbox.background", palette["surface"])
         self.option_add("*TCombobox*Listbox.foreground", palette["text"])
 
+        text_options = {
+            "bg": palette["surface"],
+            "fg": palette["text"],
+            "insertbackground": palette["text"],
+            "highlightthickness": 1,
+            "highlightbackground": palette["surface_muted"],
+            "highlightcolor": palette["accent"],
+            "selectbackground": palette["accent"],
+            "selectforeground": palette["text"],
+        }
         for widget in self._text_widgets:
-            state = widget.cget("state")
-            if state == "disabled":
-                widget.configure(state="normal")
-            widget.configure(
-                bg=palette["surface"],
-                fg=palette["text"],
-                insertbackground=palette["text"],
-                highlightthickness=1,
-                highlightbackground=palette["surface_muted"],
-                highlightcolor=palette["accent"],
-                selectbackground=palette["accent"],
-                selectforeground=palette["text"],
-            )
-            if state == "disabled":
-                widget.configure(state="disabled")
+            # Appearance options apply regardless of state; only edits need "normal".
+            widget.configure(**text_options)
 
     def _system_message(self, content: str) -> Dict[str, str]:
         """Create a system message payload for OpenRouter."""
@@ -861,11 +879,23 @@ class ApertureLauncherGUI(tk.Tk):
     def _append_chat_message(self, widget: tk.Text, speaker: str, message: str) -> None:
         """Append a message to the given chat transcript widget."""
 
+        self._append_chat_messages(widget, [(speaker, message)])
+
+    def _append_chat_messages(self, widget: tk.Text, entries: Sequence[Tuple[str, str]]) -> None:
+        """Append several (speaker, message) pairs using a single text insert."""
+
+        if not entries:
+            return
+
+        chunks: List[str] = []
+        for speaker, message in entries:
+            chunks.append(f"{speaker}: {message}\n\n")
+            chunks.append(self._ensure_chat_tag(widget, speaker))
+
         state = widget.cget("state")
         if state == "disabled":
             widget.configure(state="normal")
-        tag = self._ensure_chat_tag(widget, speaker)
-        widget.insert(tk.END, f"{speaker}: {message}\n\n", tag)
+        widget.insert(tk.END, *chunks)
         if state == "disabled":
             widget.configure(state="disabled")
         widget.see(tk.END)
@@ -873,14 +903,19 @@ class ApertureLauncherGUI(tk.Tk):
     def _ensure_chat_tag(self, widget: tk.Text, speaker: str) -> str:
         """Ensure a text tag exists for the speaker and return it."""
 
-        sanitized = "".join(ch if ch.isalnum() else "_" for ch in speaker)
-        tag_name = f"speaker_{sanitized or 'unknown'}"
-        if tag_name not in widget.tag_names():
-            color = CHAT_SPEAKER_COLORS.get(
-                speaker,
-                CHAT_SPEAKER_COLORS.get("Default", self.style.lookup("TLabel", "foreground")),
-            )
+        tag_name = self._chat_tag_names.get(speaker)
+        if tag_name is None:
+            sanitized = "".join(ch if ch.isalnum() else "_" for ch in speaker)
+            tag_name = f"speaker_{sanitized or 'unknown'}"
+            self._chat_tag_names[speaker] = tag_name
+
+        key = (str(widget), tag_name)
+        if key not in self._configured_chat_tags:
+            color = CHAT_SPEAKER_COLORS.get(speaker) or CHAT_SPEAKER_COLORS.get("Default")
+            if color is None:
+                color = self.style.lookup("TLabel", "foreground")
             widget.tag_configure(tag_name, foreground=color)
+            self._configured_chat_tags.add(key)
         return tag_name
 
     def _clear_text_widget(self, widget: tk.Text) -> None:
@@ -900,6 +935,12 @@ class ApertureLauncherGUI(tk.Tk):
         if message:
             self._append_chat_message(widget, speaker, message)
 
+    def _update_status_var(self, variable: tk.StringVar, message: str) -> None:
+        """Set a status variable only when its text actually changes."""
+
+        if variable.get() != message:
+            variable.set(message)
+
     def _set_general_busy(self, busy: bool, status: str | None = None) -> None:
         """Enable or disable general chat controls."""
 
@@ -918,7 +959,7 @@ class ApertureLauncherGUI(tk.Tk):
                 if busy
                 else f"{persona} ready for your next prompt."
             )
-        self.general_status_var.set(status)
+        self._update_status_var(self.general_status_var, status)
 
     def _invalidate_api_key(self, *_: object) -> None:
         """Mark the cached OpenRouter key as invalid when it changes."""
@@ -985,7 +1026,7 @@ class ApertureLauncherGUI(tk.Tk):
         if status is None:
             persona = self.roasting_voice_var.get()
             status = "Synthesizing a roast..." if busy else f"{persona} ready to roast."
-        self.roasting_status_var.set(status)
+        self._update_status_var(self.roasting_status_var, status)
 
     def _handle_game_selection(self, event: tk.Event | None = None) -> None:
         """Sync launcher selection with the roasting focus picker."""
@@ -1000,7 +1041,7 @@ class ApertureLauncherGUI(tk.Tk):
             return
 
         app_id = selection[0]
-        game = next((game for game in self.games if game.app_id == app_id), None)
+        game = self._games_by_id.get(app_id)
         if game is None:
             return
 
@@ -1017,7 +1058,7 @@ class ApertureLauncherGUI(tk.Tk):
     def _set_status(self, message: str) -> None:
         """Update the status bar text."""
 
-        self.status_var.set(message)
+        self._update_status_var(self.status_var, message)
 
     def _refresh_roasting_games(self) -> None:
         """Refresh the roasting game selector with the latest scan results."""
@@ -1025,12 +1066,12 @@ class ApertureLauncherGUI(tk.Tk):
         if not hasattr(self, "roasting_game_combo"):
             return
 
-        names = sorted({game.name for game in self.games})
-        values = [""] + names
+        unique_names = {game.name for game in self.games}
+        values = [""] + sorted(unique_names)
         self.roasting_game_combo.configure(values=values)
 
         current = self.roasting_game_var.get()
-        if current and current not in names:
+        if current and current not in unique_names:
             self.roasting_game_var.set("")
 
     def scan_for_games(self) -> None:
@@ -1042,26 +1083,30 @@ class ApertureLauncherGUI(tk.Tk):
         libraries = discover_steam_libraries()
         games = find_installed_games(libraries)
         self.games = games
+        self._games_by_id = {game.app_id: game for game in games}
         self._refresh_roasting_games()
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
         if not games:
             self._set_status("No Steam games detected. Ensure Steam libraries are accessible.")
             self.launch_button.configure(state="disabled")
             return
 
+        insert = self.tree.insert
         for game in games:
-            self.tree.insert(
+            insert(
                 "",
                 "end",
                 iid=game.app_id,
                 values=(game.name, game.app_id, str(game.install_dir)),
             )
 
-        self.tree.selection_set(self.tree.get_children()[0])
-        self.tree.focus(self.tree.get_children()[0])
+        first = games[0].app_id
+        self.tree.selection_set(first)
+        self.tree.focus(first)
         self._handle_game_selection()
         self._set_status(f"Found {len(games)} game(s). Select one to launch.")
 
@@ -1074,7 +1119,7 @@ class ApertureLauncherGUI(tk.Tk):
             return
 
         app_id = selection[0]
-        game = next((game for game in self.games if game.app_id == app_id), None)
+        game = self._games_by_id.get(app_id)
         if game is None:
             messagebox.showerror("Aperture Launcher", "The selected game could not be resolved.")
             return
@@ -1220,13 +1265,13 @@ class ApertureLauncherGUI(tk.Tk):
                 f"{persona} persona online. Provide a prompt to begin.",
             )
         else:
-            for message in history[1:]:
-                speaker = "Test Subject" if message["role"] == "user" else persona
-                self._append_chat_message(
-                    self.general_display,
-                    speaker,
-                    message["content"],
-                )
+            self._append_chat_messages(
+                self.general_display,
+                [
+                    ("Test Subject" if message["role"] == "user" else persona, message["content"])
+                    for message in history[1:]
+                ],
+            )
 
         if not self.general_busy and self.api_key_valid:
             self.general_status_var.set(f"{persona} ready for conversation.")
@@ -1450,9 +1495,13 @@ class ApertureLauncherGUI(tk.Tk):
                 f"{persona} persona armed. Offer something they can mock.",
             )
         else:
-            for message in history[1:]:
-                speaker = "You" if message["role"] == "user" else persona
-                self._append_chat_message(self.roasting_display, speaker, message["content"])
+            self._append_chat_messages(
+                self.roasting_display,
+                [
+                    ("You" if message["role"] == "user" else persona, message["content"])
+                    for message in history[1:]
+                ],
+            )
 
         if not self.roasting_busy:
             self.roasting_status_var.set(f"{persona} ready to roast.")
@@ -268,4 +268,6 @@ JELLYFIN_USER_ID_ENV = "JELLYFIN_USER_ID"
 JELLYFIN_DEFAULT_TIMEOUT = 20.0
 JELLYFIN_RECENT_LIMIT = 12
 JELLYFIN_WEB_UI_URL_ENV = "JELLYFIN_WEB_UI_URL"
+JELLYFIN_WEBVIEW_POLL_MS = 250
+JELLYFIN_WEBVIEW_IDLE_POLL_MS = 1000
 JELLYFIN_WEB_UI_URL = "https://smiley.citadel.usbx.me/jellyfin/web/#/home.html"
@@ -13,11 +13,18 @@ from ansi_colors import SYSTEM_ALERT, SYSTEM_PRIMARY, SYSTEM_SUCCESS
 
 EXCLUDED_APP_IDS = {"228980"}
 
+LIBRARY_PATH_PATTERN = re.compile(r"\"path\"\s*\"([^\"]+)\"")
+APP_ID_PATTERN = re.compile(r"\"appid\"\s*\"(\d+)\"")
+NAME_PATTERN = re.compile(r"\"name\"\s*\"([^\"]+)\"")
+INSTALL_DIR_PATTERN = re.compile(r"\"installdir\"\s*\"([^\"]+)\"")
+
 
 @dataclass
 class SteamGame:
     """Simple representation of a Steam game installation."""
 
+    __slots__ = ("app_id", "name", "install_dir", "library")
+
     app_id: str
     name: str
     install_dir: Path
@@ -74,7 +81,7 @@ def parse_libraryfolders(library_file: Path) -> List[Path]:
     libraries: List[Path] = []
     text = library_file.read_text(encoding="utf-8", errors="ignore")
 
-    for match in re.finditer(r"\"path\"\s*\"([^\"]+)\"", text):
+    for match in LIBRARY_PATH_PATTERN.finditer(text):
         path = Path(match.group(1)).expanduser()
         libraries.append(path / "steamapps")
 
@@ -114,9 +121,9 @@ def parse_manifest(manifest_path: Path) -> SteamGame | None:
     """Extract game information from a Steam ``appmanifest_*.acf`` file."""
 
     text = manifest_path.read_text(encoding="utf-8", errors="ignore")
-    app_id_match = re.search(r"\"appid\"\s*\"(\d+)\"", text)
-    name_match = re.search(r"\"name\"\s*\"([^\"]+)\"", text)
-    install_match = re.search(r"\"installdir\"\s*\"([^\"]+)\"", text)
+    app_id_match = APP_ID_PATTERN.search(text)
+    name_match = NAME_PATTERN.search(text)
+    install_match = INSTALL_DIR_PATTERN.search(text)
 
     if not (app_id_match and name_match and install_match):
         return None